@@ -0,0 +1,52 @@
+"""LLDB script to run several fetch commands in a single invocation.
+
+Runs fetch_hierarchy, fetch_frontmost_view and, optionally,
+fetch_swiftui_tree back to back from one Python call, so they share the
+same command interpreter and cached expression options.
+"""
+
+from __future__ import annotations
+
+import fetch_frontmost_view
+import fetch_hierarchy
+import fetch_swiftui_tree
+import lldb
+import lldb_helpers
+
+
+def fetch_all_command(debugger, command, result, internal_dict):
+    """LLDB command: fetch_all <bplist_path> <frontmost_path> [<address> <dylib_path> <swiftui_path>]
+
+    Saves the view hierarchy bplist and the frontmost view address, then the
+    SwiftUI tree of the given _UIHostingView address when one is passed,
+    using the extractor dylib at dylib_path.
+    Stops at the first command that fails.
+    """
+    args = command.split(maxsplit=4)
+    if len(args) not in (2, 5):
+        result.SetError(
+            "Usage: fetch_all <bplist_path> <frontmost_path> "
+            "[<address> <dylib_path> <swiftui_path>]"
+        )
+        return
+
+    steps = [
+        (fetch_hierarchy.fetch_hierarchy_command, args[0]),
+        (fetch_frontmost_view.fetch_frontmost_view_command, args[1]),
+    ]
+    if len(args) == 5:
+        steps.append(
+            (fetch_swiftui_tree.fetch_swiftui_tree_command, " ".join(args[2:]))
+        )
+
+    for step, step_args in steps:
+        step(debugger, step_args, result, internal_dict)
+        if result.GetStatus() == lldb.eReturnStatusFailed:
+            return
+
+
+def __lldb_init_module(debugger, internal_dict):
+    lldb_helpers.init(debugger)
+    debugger.HandleCommand(
+        "command script add -f fetch_all.fetch_all_command fetch_all"
+    )
@@ -7,82 +7,76 @@ from __future__ import annotations
 
 import re
 
-import lldb
+import lldb_helpers
 
+_HEX_RE = re.compile(r"0x[0-9a-fA-F]+")
 
-def _run_expression(debugger, expr, language="objc"):
-    """Run a single-line expression via HandleCommand and capture output."""
-    ret = lldb.SBCommandReturnObject()
-    if language == "swift":
-        debugger.GetCommandInterpreter().HandleCommand(
-            f"expression -l swift -O -- {expr}", ret
-        )
-    else:
-        debugger.GetCommandInterpreter().HandleCommand(
-            f"expression -l objc -O -- {expr}", ret
-        )
-    if ret.Succeeded():
-        return ret.GetOutput().strip()
-    return None
+# Walks from the key window's root view controller to the frontmost one and
+# formats its view's address. The whole walk is a single expression so LLDB
+# only parses and JITs once.
+_FRONTMOST_VIEW_EXPR = r"""
+@import UIKit;
+UIWindowScene *scene = (UIWindowScene *)[[[UIApplication sharedApplication] connectedScenes] anyObject];
+UIViewController *vc = scene.keyWindow.rootViewController;
+UIViewController *prev = nil;
+while (vc != prev) {
+    prev = vc;
+    if (vc.presentedViewController != nil) {
+        vc = vc.presentedViewController;
+    } else if ([vc isKindOfClass:[UINavigationController class]]) {
+        UIViewController *top = ((UINavigationController *)vc).topViewController;
+        if (top != nil && top != vc) { vc = top; }
+    } else if ([vc isKindOfClass:[UITabBarController class]]) {
+        UIViewController *selected = ((UITabBarController *)vc).selectedViewController;
+        if (selected != nil && selected != vc) { vc = selected; }
+    } else {
+        for (UIViewController *child in vc.childViewControllers) {
+            if (child.viewIfLoaded != nil && child.viewIfLoaded.window != nil) {
+                vc = child;
+                break;
+            }
+        }
+    }
+}
+[NSString stringWithFormat:@"%p", vc.view]
+"""
 
 
 def fetch_frontmost_view_command(debugger, command, result, internal_dict):
     """LLDB command: fetch_frontmost_view [output_path]
 
     Finds the frontmost view controller's view address and writes it to a file.
+    The walk runs as one expression; the file is written from Python.
     """
     output_path = command.strip()
     if not output_path:
         result.SetError("Usage: fetch_frontmost_view <output_path>")
         return
 
-    expr = r"""
-    @import UIKit;
-    UIWindowScene *scene = (UIWindowScene *)[[[UIApplication sharedApplication] connectedScenes] anyObject];
-    UIViewController *vc = scene.keyWindow.rootViewController;
-    UIViewController *prev = nil;
-    while (vc != prev) {
-        prev = vc;
-        if (vc.presentedViewController != nil) {
-            vc = vc.presentedViewController;
-        } else if ([vc isKindOfClass:[UINavigationController class]]) {
-            UIViewController *top = ((UINavigationController *)vc).topViewController;
-            if (top != nil && top != vc) { vc = top; }
-        } else if ([vc isKindOfClass:[UITabBarController class]]) {
-            UIViewController *selected = ((UITabBarController *)vc).selectedViewController;
-            if (selected != nil && selected != vc) { vc = selected; }
-        } else {
-            for (UIViewController *child in vc.childViewControllers) {
-                if (child.viewIfLoaded != nil && child.viewIfLoaded.window != nil) {
-                    vc = child;
-                    break;
-                }
-            }
-        }
-    }
-    [NSString stringWithFormat:@"%p", vc.view]
-    """
-    output = _run_expression(debugger, expr, language="objc")
+    val = lldb_helpers.run_expression(debugger, _FRONTMOST_VIEW_EXPR)
+    output = (val.GetObjectDescription() or "").strip() if val else ""
     if not output:
         result.SetError("Failed to find frontmost view controller's view")
         return
 
-    m = re.search(r"0x[0-9a-fA-F]+", output)
+    m = _HEX_RE.search(output)
     if not m:
         result.SetError(f"Could not parse address from: {output}")
         return
 
     address = m.group(0)
-    write_expr = (
-        f'(BOOL)[@"{address}" writeToFile:@"{output_path}" '
-        f'atomically:YES encoding:4 error:nil]'
-    )
-    _run_expression(debugger, write_expr)
+    try:
+        with open(output_path, "w") as f:
+            f.write(address)
+    except OSError as e:
+        result.SetError(f"Failed to write frontmost view address: {e}")
+        return
 
     result.AppendMessage(f"Frontmost view: {address} (saved to {output_path})")
 
 
 def __lldb_init_module(debugger, internal_dict):
-    debugger.HandleCommand(
+    lldb_helpers.init(debugger)
+    lldb_helpers.handle_command(
         "command script add -f fetch_frontmost_view.fetch_frontmost_view_command fetch_frontmost_view"
     )
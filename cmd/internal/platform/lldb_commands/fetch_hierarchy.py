@@ -7,22 +7,49 @@ saving the resulting bplist to a specified file path.
 from __future__ import annotations
 
 import lldb
+import lldb_helpers
 
+_SUPPORT_DYLIB = "libViewDebuggerSupport.dylib"
+_DLOPEN_EXPR = f'(void *)dlopen("/usr/lib/{_SUPPORT_DYLIB}", 2)'
 
-def _run_expression(debugger, expr, language="objc"):
-    """Run a single-line expression via HandleCommand and capture output."""
-    ret = lldb.SBCommandReturnObject()
-    if language == "swift":
-        debugger.GetCommandInterpreter().HandleCommand(
-            f"expression -l swift -O -- {expr}", ret
-        )
-    else:
-        debugger.GetCommandInterpreter().HandleCommand(
-            f"expression -l objc -O -- {expr}", ret
-        )
-    if ret.Succeeded():
-        return ret.GetOutput().strip()
-    return None
+# Calls +[DBGViewDebuggerSupport_iOS fetchViewHierarchy] and evaluates to the
+# returned NSData's buffer address and length. A plain message send: every
+# axe invocation starts a fresh LLDB, so a pre-resolved IMP could never be
+# reused across calls.
+_FETCH_EXPR = """
+@import Foundation;
+NSData *data = (NSData *)[(id)objc_getClass("DBGViewDebuggerSupport_iOS") fetchViewHierarchy];
+(NSRange){(NSUInteger)[data bytes], [data length]}
+"""
+
+
+def _is_image_loaded(debugger, filename):
+    """Return True if an image with the given file name is loaded in the target."""
+    for module in debugger.GetSelectedTarget().module_iter():
+        if module.GetFileSpec().GetFilename() == filename:
+            return True
+    return False
+
+
+def _read_hierarchy_bytes(debugger):
+    """Fetch the hierarchy and copy its bplist bytes out of the target.
+
+    The expression only returns the NSData buffer address and length;
+    the bytes are then read with SBProcess.ReadMemory instead of having
+    the target write the file itself. Returns None on failure.
+    """
+    val = lldb_helpers.run_expression(debugger, _FETCH_EXPR)
+    if val is None:
+        return None
+    address = val.GetChildMemberWithName("location").GetValueAsUnsigned()
+    length = val.GetChildMemberWithName("length").GetValueAsUnsigned()
+    if address == 0 or length == 0:
+        return None
+    err = lldb.SBError()
+    data = debugger.GetSelectedTarget().GetProcess().ReadMemory(address, length, err)
+    if not err.Success():
+        return None
+    return data
 
 
 def fetch_hierarchy_command(debugger, command, result, internal_dict):
@@ -36,29 +63,31 @@ def fetch_hierarchy_command(debugger, command, result, internal_dict):
         result.SetError("Usage: fetch_hierarchy <output_path>")
         return
 
-    # Load the ViewDebuggerSupport framework
-    dlopen_result = _run_expression(
-        debugger,
-        '(void *)dlopen("/usr/lib/libViewDebuggerSupport.dylib", 2)',
-    )
-    if dlopen_result is None:
-        result.SetError("Failed to dlopen libViewDebuggerSupport.dylib")
+    # Load the ViewDebuggerSupport framework unless an earlier fetch (or
+    # Xcode's view debugger) already did, which saves a whole expression.
+    if not _is_image_loaded(debugger, _SUPPORT_DYLIB):
+        handle = lldb_helpers.run_expression(debugger, _DLOPEN_EXPR)
+        if handle is None or handle.GetValueAsUnsigned() == 0:
+            result.SetError(f"Failed to dlopen {_SUPPORT_DYLIB}")
+            return
+
+    data = _read_hierarchy_bytes(debugger)
+    if data is None:
+        result.SetError("Failed to call fetchViewHierarchy or read bplist")
         return
 
-    # Call fetchViewHierarchy and write to file
-    write_result = _run_expression(
-        debugger,
-        f'(BOOL)[(NSData *)[DBGViewDebuggerSupport_iOS fetchViewHierarchy] '
-        f'writeToFile:@"{output_path}" atomically:YES]',
-    )
-    if write_result is None:
-        result.SetError("Failed to call fetchViewHierarchy or write bplist")
+    try:
+        with open(output_path, "wb") as f:
+            f.write(data)
+    except OSError as e:
+        result.SetError(f"Failed to write bplist: {e}")
         return
 
     result.AppendMessage(f"View hierarchy saved to {output_path}")
 
 
 def __lldb_init_module(debugger, internal_dict):
-    debugger.HandleCommand(
+    lldb_helpers.init(debugger)
+    lldb_helpers.handle_command(
         "command script add -f fetch_hierarchy.fetch_hierarchy_command fetch_hierarchy"
     )
@@ -1,89 +1,81 @@
 """LLDB script to fetch SwiftUI view debug data from a _UIHostingView.
 
-Uses _viewDebugData() with Mirror reflection to extract the SwiftUI view
-tree as JSON, including text content and modifier values.
+Loads axe's SwiftUI extractor dylib into the target, which uses
+_viewDebugData() to write the SwiftUI view tree as JSON, including text
+content and modifier values.
 """
 
 from __future__ import annotations
 
-import json
-
-import lldb
-
-# Swift function that recursively converts _ViewDebug.Data to NSDictionary.
-# Accesses internal `data` (Dictionary<Property, Any>) and `childData` (Array<Data>)
-# via Mirror to bypass access control.
-_EXTRACT_NODE_SWIFT = """
-func extractNode(_ node: _ViewDebug.Data) -> NSDictionary {
-    var result = [String: Any]()
-    let m = Mirror(reflecting: node)
-    for child in m.children {
-        switch child.label {
-        case "data":
-            for entry in Mirror(reflecting: child.value).children {
-                let kv = Array(Mirror(reflecting: entry.value).children)
-                guard kv.count == 2 else { continue }
-                result["\\(kv[0].value)"] = "\\(kv[1].value)" as NSString
-            }
-        case "childData":
-            if let arr = child.value as? [_ViewDebug.Data] {
-                result["children"] = arr.map { extractNode($0) } as NSArray
-            }
-        default: break
-        }
-    }
-    return result as NSDictionary
-}
+import re
+
+import lldb_helpers
+
+# Matches environment lines from `platform process info`. Current LLDB prints
+# them as "env[KEY] = VALUE"; older builds printed "env[N] = KEY=VALUE".
+_ENV_LINE_RE = re.compile(r"^\s*env\[([^\]]+)\] = (.*)$", re.MULTILINE)
+
+# Loads the extractor dylib built by axe (see swiftui_extractor.go) and calls
+# its C entry point, which walks _viewDebugData() and writes the JSON file
+# inside the target process. Evaluates to 1 on success, 0 if extraction or
+# writing failed, and -1 if the dylib or its symbol could not be loaded.
+_EXTRACT_EXPR = """
+void *handle = (void *)dlopen("{dylib_path}", 2);
+BOOL (*extract)(void *, const char *) = handle == NULL ? NULL
+    : (BOOL (*)(void *, const char *))dlsym(handle, "axe_extract_viewdebugdata");
+extract == NULL ? -1 : (int)extract((void *){address}, "{output_path}")
 """
 
 
-def _run_swift_expression(debugger, expr):
-    """Run a multi-line Swift expression via SBFrame.EvaluateExpression.
+def _read_launch_environment(debugger):
+    """Read the target process environment from its process info.
 
-    Uses SetIgnoreBreakpoints(True) to avoid EXC_BREAKPOINT failures
-    when ObjC expressions have been evaluated earlier in the same
-    LLDB session (e.g. by fetch_hierarchy.py).
+    `platform process info` reports the environment the process was launched
+    with straight from the host, so no expression has to be compiled.
+    Returns None when the platform does not report an environment.
     """
-    frame = (
-        debugger.GetSelectedTarget()
-        .GetProcess()
-        .GetSelectedThread()
-        .GetSelectedFrame()
-    )
-    opts = lldb.SBExpressionOptions()
-    opts.SetLanguage(lldb.eLanguageTypeSwift)
-    opts.SetTimeoutInMicroSeconds(60_000_000)
-    opts.SetIgnoreBreakpoints(True)
-    val = frame.EvaluateExpression(expr, opts)
-    if val.GetError().Success():
-        return val.GetObjectDescription() or val.GetValue()
-    return None
+    pid = debugger.GetSelectedTarget().GetProcess().GetProcessID()
+    ret = lldb_helpers.handle_command(f"platform process info {pid}")
+    if not ret.Succeeded():
+        return None
+    env = {}
+    for m in _ENV_LINE_RE.finditer(ret.GetOutput()):
+        key, value = m.group(1), m.group(2)
+        if key.isdigit() and "=" in value:
+            key, value = value.split("=", 1)
+        env[key] = value
+    return env or None
 
 
 def fetch_swiftui_tree_command(debugger, command, result, internal_dict):
-    """LLDB command: fetch_swiftui_tree <address> [output_path]
+    """LLDB command: fetch_swiftui_tree <address> <dylib_path> <output_path>
 
-    Calls _viewDebugData() on the given _UIHostingView address via Mirror
-    and writes the resulting JSON to the given file path.
+    Loads the extractor dylib, calls _viewDebugData() on the given
+    _UIHostingView address and writes the resulting JSON to the given file path.
     """
-    args = command.strip().split()
-    if len(args) < 2:
-        result.SetError("Usage: fetch_swiftui_tree <address> <output_path>")
+    # Everything after the dylib path is the output path, which may contain spaces.
+    args = command.split(maxsplit=2)
+    if len(args) < 3:
+        result.SetError(
+            "Usage: fetch_swiftui_tree <address> <dylib_path> <output_path>"
+        )
         return
 
-    address = args[0]
-    output_path = args[1]
+    address, dylib_path, output_path = args
 
     # Check that SWIFTUI_VIEW_DEBUG=287 is set in the target process.
-    # Use Swift (not ObjC) to avoid language-switch issues that cause
-    # EXC_BREAKPOINT in the subsequent Swift expression evaluation.
-    env_val = _run_swift_expression(
-        debugger,
-        """
-        import Foundation
-        ProcessInfo.processInfo.environment["SWIFTUI_VIEW_DEBUG"] ?? "NOT_SET"
-        """,
-    )
+    # Prefer the environment reported by the platform; only fall back to
+    # evaluating an expression when it is unavailable.
+    env = _read_launch_environment(debugger)
+    if env is not None:
+        env_val = env.get("SWIFTUI_VIEW_DEBUG")
+    else:
+        val = lldb_helpers.run_expression(
+            debugger,
+            '(NSString *)[[[NSProcessInfo processInfo] environment] '
+            'objectForKey:@"SWIFTUI_VIEW_DEBUG"] ?: @"NOT_SET"',
+        )
+        env_val = val.GetObjectDescription() if val else None
     if env_val is None or "287" not in env_val:
         result.SetError(
             "SWIFTUI_VIEW_DEBUG_NOT_SET: "
@@ -92,37 +84,33 @@ def fetch_swiftui_tree_command(debugger, command, result, internal_dict):
         )
         return
 
-    # Convert address string to integer for unsafeBitCast
-    expr = f"""
-    import SwiftUI
-    import Foundation
-    {_EXTRACT_NODE_SWIFT}
-    let raw = unsafeBitCast({address} as Int, to: _UIHostingView<AnyView>.self)._viewDebugData()
-    let result = raw.map {{ extractNode($0) }} as NSArray
-    let json = try! JSONSerialization.data(withJSONObject: result)
-    String(data: json, encoding: .utf8)!
-    """
-
-    output = _run_swift_expression(debugger, expr)
-    if not output:
+    # The JSON is written by the target process itself; only a status code
+    # crosses the debugger boundary.
+    val = lldb_helpers.run_expression(
+        debugger,
+        _EXTRACT_EXPR.format(
+            dylib_path=dylib_path, address=address, output_path=output_path
+        ),
+    )
+    if val is None:
         result.SetError(
             f"Failed to call _viewDebugData() on view at {address}"
         )
         return
 
-    # Validate JSON and write to file
-    try:
-        parsed = json.loads(output)
-        with open(output_path, "w") as f:
-            json.dump(parsed, f, ensure_ascii=False)
-    except (json.JSONDecodeError, OSError) as e:
-        result.SetError(f"Failed to write SwiftUI tree JSON: {e}")
+    status = val.GetValueAsSigned()
+    if status < 0:
+        result.SetError(f"Failed to load SwiftUI extractor from {dylib_path}")
+        return
+    if status == 0:
+        result.SetError(f"Failed to write SwiftUI tree JSON to {output_path}")
         return
 
     result.AppendMessage(f"SwiftUI tree saved to {output_path}")
 
 
 def __lldb_init_module(debugger, internal_dict):
-    debugger.HandleCommand(
+    lldb_helpers.init(debugger)
+    lldb_helpers.handle_command(
         "command script add -f fetch_swiftui_tree.fetch_swiftui_tree_command fetch_swiftui_tree"
     )
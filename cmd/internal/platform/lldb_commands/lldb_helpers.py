@@ -0,0 +1,66 @@
+"""Helpers shared by axe's LLDB command scripts.
+
+Not a command itself: the fetch_* scripts import it as a sibling module,
+which works because `command script import` puts this directory on sys.path.
+"""
+
+from __future__ import annotations
+
+import lldb
+
+# Options for every expression, built once at import. All scripts evaluate
+# ObjC, so running them in one session never switches parser languages.
+# SetIgnoreBreakpoints(True) avoids EXC_BREAKPOINT failures when several
+# scripts evaluate expressions in the same LLDB session.
+OPTS = lldb.SBExpressionOptions()
+OPTS.SetLanguage(lldb.eLanguageTypeObjC)
+OPTS.SetIgnoreBreakpoints(True)
+OPTS.SetTimeoutInMicroSeconds(60_000_000)
+
+# The scripts' expressions do write target memory (dlopen, allocations, the
+# fetched NSData), but LLDB flushes its memory cache whenever the target runs,
+# so later reads still see fresh bytes. With tracking off, the writes LLDB
+# makes while setting up each expression no longer bump the memory
+# modification ID, which would otherwise force synthetic children and
+# convenience variables to be re-evaluated. LLDB builds that lack the
+# setting reject it, which is harmless.
+_MEMORY_CACHE_SETTING = "settings set target.process.track-memory-cache-changes false"
+
+# Command interpreter of the debugger the scripts were imported into.
+_CI = None
+
+
+def init(debugger):
+    """Cache the interpreter and apply session settings once.
+
+    Called by each __lldb_init_module; only the first call has an effect.
+    """
+    global _CI
+    if _CI is not None:
+        return
+    _CI = debugger.GetCommandInterpreter()
+    handle_command(_MEMORY_CACHE_SETTING)
+
+
+def handle_command(command):
+    """Run an LLDB command through the cached interpreter and return its result."""
+    ret = lldb.SBCommandReturnObject()
+    _CI.HandleCommand(command, ret)
+    return ret
+
+
+def run_expression(debugger, expr):
+    """Run an ObjC expression via SBFrame.EvaluateExpression and return its SBValue.
+
+    Returns None if the expression fails.
+    """
+    frame = (
+        debugger.GetSelectedTarget()
+        .GetProcess()
+        .GetSelectedThread()
+        .GetSelectedFrame()
+    )
+    val = frame.EvaluateExpression(expr, OPTS)
+    if val.GetError().Success():
+        return val
+    return None
@@ -0,0 +1,93 @@
+package platform
+
+import (
+	"crypto/sha256"
+	"fmt"
+	"log/slog"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"strings"
+)
+
+// SimDylib describes a dylib built from embedded source for the iOS simulator
+// and cached on disk between runs.
+type SimDylib struct {
+	// Name labels the dylib in log and error messages (e.g. "loader").
+	Name string
+	// Dir is where the source, dylib, and cache hash are written. It must be
+	// readable by the simulator process that loads the dylib.
+	Dir string
+	// SourceFile, DylibFile, and HashFile are file names within Dir.
+	// HashFile holds the cache key of the last successful build.
+	SourceFile string
+	DylibFile  string
+	HashFile   string
+	// Source is the embedded source code.
+	Source string
+	// DeploymentTarget is the minimum iOS version, e.g. "17.0".
+	DeploymentTarget string
+	// CompileArgs returns the full compiler command line (starting with
+	// "xcrun") for the given SDK path, target triple, and source/output paths.
+	CompileArgs func(sdk, target, srcPath, dylibPath string) []string
+}
+
+// simDylibCacheKey computes a SHA256 cache key from the source, SDK path,
+// and deployment target. This ensures the cached dylib is invalidated when
+// any of these change (e.g. Xcode update).
+func simDylibCacheKey(source, sdk, deploymentTarget string) string {
+	hashInput := source + "\x00" + sdk + "\x00" + deploymentTarget
+	return fmt.Sprintf("%x", sha256.Sum256([]byte(hashInput)))
+}
+
+// CompileSimDylib compiles d for the simulator, ad-hoc codesigns it, and
+// returns the dylib path. Recompilation is skipped if the cache key matches.
+func CompileSimDylib(d SimDylib) (string, error) {
+	if err := os.MkdirAll(d.Dir, 0o755); err != nil {
+		return "", fmt.Errorf("creating %s dir: %w", d.Name, err)
+	}
+
+	dylibPath := filepath.Join(d.Dir, d.DylibFile)
+	hashPath := filepath.Join(d.Dir, d.HashFile)
+
+	// SDK path is needed both for cache key and compilation
+	sdkPathOut, err := exec.Command("xcrun", "--sdk", "iphonesimulator", "--show-sdk-path").Output()
+	if err != nil {
+		return "", fmt.Errorf("getting simulator SDK path: %w", err)
+	}
+	sdk := strings.TrimSpace(string(sdkPathOut))
+
+	currentHash := simDylibCacheKey(d.Source, sdk, d.DeploymentTarget)
+	if _, err := os.Stat(dylibPath); err == nil {
+		if cached, err := os.ReadFile(hashPath); err == nil && string(cached) == currentHash {
+			slog.Debug("Dylib cached, skipping compile", "name", d.Name, "path", dylibPath)
+			return dylibPath, nil
+		}
+	}
+
+	srcPath := filepath.Join(d.Dir, d.SourceFile)
+	if err := os.WriteFile(srcPath, []byte(d.Source), 0o600); err != nil {
+		return "", fmt.Errorf("writing %s source: %w", d.Name, err)
+	}
+
+	target := fmt.Sprintf("arm64-apple-ios%s-simulator", d.DeploymentTarget)
+
+	compileArgs := d.CompileArgs(sdk, target, srcPath, dylibPath)
+	slog.Debug("Compiling dylib", "name", d.Name, "args", compileArgs)
+	if out, err := exec.Command(compileArgs[0], compileArgs[1:]...).CombinedOutput(); err != nil {
+		return "", fmt.Errorf("compiling %s: %w\n%s", d.Name, err, out)
+	}
+
+	// Ad-hoc codesign
+	if out, err := exec.Command("codesign", "--force", "--sign", "-", dylibPath).CombinedOutput(); err != nil {
+		return "", fmt.Errorf("codesigning %s: %w\n%s", d.Name, err, out)
+	}
+
+	// Save source hash for cache invalidation
+	if err := os.WriteFile(hashPath, []byte(currentHash), 0o600); err != nil {
+		slog.Warn("Failed to write dylib hash", "name", d.Name, "err", err)
+	}
+
+	slog.Debug("Dylib ready", "name", d.Name, "path", dylibPath)
+	return dylibPath, nil
+}
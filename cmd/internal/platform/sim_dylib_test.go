@@ -0,0 +1,47 @@
+package platform
+
+import "testing"
+
+func TestSimDylibCacheKey_IncludesAllInputs(t *testing.T) {
+	base := simDylibCacheKey("source", "/sdk/path", "17.0")
+
+	// Same inputs must produce the same key
+	if got := simDylibCacheKey("source", "/sdk/path", "17.0"); got != base {
+		t.Errorf("same inputs produced different keys: %s vs %s", got, base)
+	}
+
+	// Changing any single input must produce a different key
+	tests := []struct {
+		name             string
+		source, sdk, dep string
+	}{
+		{"different source", "source2", "/sdk/path", "17.0"},
+		{"different sdk", "source", "/sdk/path2", "17.0"},
+		{"different deployment target", "source", "/sdk/path", "18.0"},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := simDylibCacheKey(tt.source, tt.sdk, tt.dep); got == base {
+				t.Errorf("expected different key for %s, got same: %s", tt.name, got)
+			}
+		})
+	}
+}
+
+func TestSimDylibCacheKey_NoDelimiterCollision(t *testing.T) {
+	// Fields that share a boundary must not collide.
+	// e.g. shifting content across the delimiter boundary must produce a different key.
+	a := simDylibCacheKey("src", "/sdk/path", "17.0")
+	b := simDylibCacheKey("src\x00/sdk", "path", "17.0")
+	if a == b {
+		t.Error("delimiter collision: different field boundaries produced the same key")
+	}
+}
+
+func TestSimDylibCacheKey_Format(t *testing.T) {
+	key := simDylibCacheKey("src", "/sdk", "17.0")
+	// SHA256 hex digest is 64 characters
+	if len(key) != 64 {
+		t.Errorf("expected 64-char hex digest, got %d chars: %s", len(key), key)
+	}
+}
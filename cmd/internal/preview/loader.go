@@ -2,16 +2,14 @@ package preview
 
 import (
 	"bufio"
-	"crypto/sha256"
 	_ "embed"
 	"fmt"
 	"log/slog"
 	"net"
-	"os"
-	"os/exec"
-	"path/filepath"
 	"strings"
 	"time"
+
+	"github.com/k-kohey/axe/internal/platform"
 )
 
 // loaderSource is an Objective-C source that acts as a dylib loader injected
@@ -28,75 +26,31 @@ import (
 //go:embed loader_source/loader.m
 var loaderSource string
 
-// loaderCacheKey computes a SHA256 cache key from the loader source,
-// SDK path, and deployment target. This ensures the cached dylib is
-// invalidated when any of these change (e.g. Xcode update).
-func loaderCacheKey(source, sdk, deploymentTarget string) string {
-	hashInput := source + "\x00" + sdk + "\x00" + deploymentTarget
-	return fmt.Sprintf("%x", sha256.Sum256([]byte(hashInput)))
-}
-
 // compileLoader compiles the Obj-C loader dylib for the simulator.
 // The result is cached: recompilation is skipped if the source hash matches.
 func compileLoader(dirs previewDirs, deploymentTarget string) (string, error) {
-	if err := os.MkdirAll(dirs.Loader, 0o755); err != nil {
-		return "", fmt.Errorf("creating loader dir: %w", err)
-	}
-
-	dylibPath := filepath.Join(dirs.Loader, "axe-preview-loader.dylib")
-	hashPath := filepath.Join(dirs.Loader, "loader.sha256")
-
-	// SDK path is needed both for cache key and compilation
-	sdkPathOut, err := exec.Command("xcrun", "--sdk", "iphonesimulator", "--show-sdk-path").Output()
-	if err != nil {
-		return "", fmt.Errorf("getting simulator SDK path: %w", err)
-	}
-	sdk := strings.TrimSpace(string(sdkPathOut))
-
-	// Check if source hash matches the cached build
-	currentHash := loaderCacheKey(loaderSource, sdk, deploymentTarget)
-	if _, err := os.Stat(dylibPath); err == nil {
-		if cached, err := os.ReadFile(hashPath); err == nil && string(cached) == currentHash {
-			slog.Debug("Loader dylib cached, skipping compile", "path", dylibPath)
-			return dylibPath, nil
-		}
-	}
-
-	srcPath := filepath.Join(dirs.Loader, "loader.m")
-	if err := os.WriteFile(srcPath, []byte(loaderSource), 0o600); err != nil {
-		return "", fmt.Errorf("writing loader source: %w", err)
-	}
-
-	target := fmt.Sprintf("arm64-apple-ios%s-simulator", deploymentTarget)
-
-	compileArgs := []string{
-		"xcrun", "clang",
-		"-dynamiclib",
-		"-fobjc-arc",
-		"-target", target,
-		"-isysroot", sdk,
-		"-framework", "Foundation",
-		"-framework", "UIKit",
-		"-o", dylibPath,
-		srcPath,
-	}
-	slog.Debug("Compiling loader", "args", compileArgs)
-	if out, err := exec.Command(compileArgs[0], compileArgs[1:]...).CombinedOutput(); err != nil {
-		return "", fmt.Errorf("compiling loader: %w\n%s", err, out)
-	}
-
-	// Ad-hoc codesign
-	if out, err := exec.Command("codesign", "--force", "--sign", "-", dylibPath).CombinedOutput(); err != nil {
-		return "", fmt.Errorf("codesigning loader: %w\n%s", err, out)
-	}
-
-	// Save source hash for cache invalidation
-	if err := os.WriteFile(hashPath, []byte(currentHash), 0o600); err != nil {
-		slog.Warn("Failed to write loader hash", "err", err)
-	}
-
-	slog.Debug("Loader dylib ready", "path", dylibPath)
-	return dylibPath, nil
+	return platform.CompileSimDylib(platform.SimDylib{
+		Name:             "loader",
+		Dir:              dirs.Loader,
+		SourceFile:       "loader.m",
+		DylibFile:        "axe-preview-loader.dylib",
+		HashFile:         "loader.sha256",
+		Source:           loaderSource,
+		DeploymentTarget: deploymentTarget,
+		CompileArgs: func(sdk, target, srcPath, dylibPath string) []string {
+			return []string{
+				"xcrun", "clang",
+				"-dynamiclib",
+				"-fobjc-arc",
+				"-target", target,
+				"-isysroot", sdk,
+				"-framework", "Foundation",
+				"-framework", "UIKit",
+				"-o", dylibPath,
+				srcPath,
+			}
+		},
+	})
 }
 
 // sendReloadCommand connects to the loader's Unix domain socket and sends
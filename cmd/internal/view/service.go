@@ -82,10 +82,19 @@ func runSwiftUITreeLLDB(appName string, address string, swiftuiJSONPath string,
 		return err
 	}
 
+	extractorPath, err := compileSwiftUIExtractor()
+	if err != nil {
+		return err
+	}
+
 	slog.Info("Fetching SwiftUI tree", "name", name, "pid", pid)
+
+	// Remove any JSON left by an earlier run so a failed fetch is not
+	// mistaken for a fresh tree.
+	_ = os.Remove(swiftuiJSONPath)
 	lldbOut, err := platform.RunLLDB(pid, []string{
 		fmt.Sprintf("command script import %s/fetch_swiftui_tree.py", pythonDir),
-		fmt.Sprintf("fetch_swiftui_tree %s %s", address, swiftuiJSONPath),
+		fmt.Sprintf("fetch_swiftui_tree %s %s %s", address, extractorPath, swiftuiJSONPath),
 	})
 	if err != nil {
 		if strings.Contains(lldbOut, "SWIFTUI_VIEW_DEBUG_NOT_SET") {
@@ -169,10 +178,8 @@ func RunTree(appName string, maxDepth int, frontmost bool, device string) (TreeO
 
 		_ = os.Remove(frontmostPath)
 		_, err = platform.RunLLDB(pid, []string{
-			fmt.Sprintf("command script import %s/fetch_hierarchy.py", pythonDir),
-			fmt.Sprintf("command script import %s/fetch_frontmost_view.py", pythonDir),
-			fmt.Sprintf("fetch_hierarchy %s", bplistPath),
-			fmt.Sprintf("fetch_frontmost_view %s", frontmostPath),
+			fmt.Sprintf("command script import %s/fetch_all.py", pythonDir),
+			fmt.Sprintf("fetch_all %s %s", bplistPath, frontmostPath),
 		})
 		if err != nil {
 			return TreeOutput{}, err
@@ -275,8 +282,8 @@ func RunDetail(appName string, address string, swiftUI string, device string) (D
 	uikit := buildDetailWithSnapshot(*node, bplistData.Classmap, demangled)
 	detail := DetailOutput{UIKit: uikit}
 
-	// Fetch SwiftUI tree in a separate LLDB session to avoid
-	// ObjC/Swift language-switch issues within a single session.
+	// Fetch SwiftUI tree in a separate LLDB session: whether it is needed
+	// depends on the hierarchy above, which may come from the cached bplist.
 	if uikit.IsHostingView && swiftUI != "none" {
 		swiftuiJSON := filepath.Join(os.TempDir(), "axe_swiftui_tree.json")
 		if err := runSwiftUITreeLLDB(appName, address, swiftuiJSON, device); err != nil {
@@ -0,0 +1,54 @@
+package view
+
+import (
+	_ "embed"
+	"os"
+	"path/filepath"
+
+	"github.com/k-kohey/axe/internal/platform"
+)
+
+// swiftUIExtractorSource is a Swift source compiled into a dylib that
+// fetch_swiftui_tree.py dlopen()s into the target app. It exports
+// axe_extract_viewdebugdata, which walks a _UIHostingView's _viewDebugData()
+// and writes the tree as JSON, so LLDB only evaluates a one-line call
+// instead of JIT-compiling the extractor on every fetch.
+//
+//go:embed swiftui_extractor_source/extractor.swift
+var swiftUIExtractorSource string
+
+// swiftUIExtractorDeploymentTarget is the minimum iOS version the extractor
+// is built for. It only needs to be old enough to load into any app axe
+// can attach to.
+const swiftUIExtractorDeploymentTarget = "15.0"
+
+// compileSwiftUIExtractor compiles the SwiftUI extractor dylib for the simulator.
+// The dylib is placed under ~/Library/Caches/axe/ so the simulator process can
+// dlopen it, and recompilation is skipped if the source hash matches.
+func compileSwiftUIExtractor() (string, error) {
+	cacheDir, err := os.UserCacheDir()
+	if err != nil {
+		cacheDir = filepath.Join(os.Getenv("HOME"), "Library", "Caches")
+	}
+	return platform.CompileSimDylib(platform.SimDylib{
+		Name:             "SwiftUI extractor",
+		Dir:              filepath.Join(cacheDir, "axe", "swiftui-extractor"),
+		SourceFile:       "extractor.swift",
+		DylibFile:        "libAxeSwiftUIExtract.dylib",
+		HashFile:         "extractor.sha256",
+		Source:           swiftUIExtractorSource,
+		DeploymentTarget: swiftUIExtractorDeploymentTarget,
+		CompileArgs: func(sdk, target, srcPath, dylibPath string) []string {
+			return []string{
+				"xcrun", "swiftc",
+				"-emit-library",
+				"-O",
+				"-module-name", "AxeSwiftUIExtract",
+				"-target", target,
+				"-sdk", sdk,
+				"-o", dylibPath,
+				srcPath,
+			}
+		},
+	})
+}
@@ -0,0 +1,138 @@
+import Foundation
+import SwiftUI
+
+// SwiftUI tree extractor loaded into the target app by fetch_swiftui_tree.py.
+//
+// Exported through the C ABI so LLDB can call it from a one-line expression
+// instead of JIT-compiling the extraction code on every invocation.
+
+/// Mirrors the stored-property layout of `_ViewDebug.Data`, whose `data` and
+/// `childData` are internal, so a node can be read without Mirror.
+private struct DataShadow {
+  var data: [_ViewDebug.Property: Any]
+  var childData: [_ViewDebug.Data]
+}
+
+/// unsafeBitCast traps when the sizes differ, which would kill the target
+/// app, so the shadow is only used while its size still matches.
+private let shadowMatchesLayout =
+  MemoryLayout<_ViewDebug.Data>.size == MemoryLayout<DataShadow>.size
+
+/// Reads a node's storage with Mirror. Slower than the shadow struct, but
+/// safe if SwiftUI changes the layout of `_ViewDebug.Data`.
+private func mirrorShadow(_ node: _ViewDebug.Data) -> DataShadow {
+  var shadow = DataShadow(data: [:], childData: [])
+  for child in Mirror(reflecting: node).children {
+    switch child.label {
+    case "data":
+      for entry in Mirror(reflecting: child.value).children {
+        let kv = Array(Mirror(reflecting: entry.value).children)
+        guard kv.count == 2, let property = kv[0].value as? _ViewDebug.Property else { continue }
+        shadow.data[property] = kv[1].value
+      }
+    case "childData":
+      shadow.childData = child.value as? [_ViewDebug.Data] ?? []
+    default: break
+    }
+  }
+  return shadow
+}
+
+private func readShadow(_ node: _ViewDebug.Data) -> DataShadow {
+  shadowMatchesLayout ? unsafeBitCast(node, to: DataShadow.self) : mirrorShadow(node)
+}
+
+/// Labels for the properties axe reads are known up front; any other case
+/// is formatted once on first sight and reused for every node.
+private var propertyLabels: [_ViewDebug.Property: String] = [
+  .type: "type", .value: "value", .transform: "transform",
+  .position: "position", .size: "size",
+]
+
+private func label(for property: _ViewDebug.Property) -> String {
+  if let cached = propertyLabels[property] { return cached }
+  let name = "\(property)"
+  propertyLabels[property] = name
+  return name
+}
+
+/// Formats common concrete value types directly so that only unknown types
+/// go through String(describing:) and its runtime protocol lookups.
+private func format(_ value: Any) -> String {
+  switch value {
+  case let string as String: return string
+  case let int as Int: return String(int)
+  case let double as Double: return double.description
+  case let float as CGFloat: return float.description
+  case let size as CGSize: return "(\(size.width.description), \(size.height.description))"
+  case let point as CGPoint: return "(\(point.x.description), \(point.y.description))"
+  default: return "\(value)"
+  }
+}
+
+/// JSON key used to encode node properties next to "children".
+private struct NodeKey: CodingKey {
+  var stringValue: String
+  var intValue: Int? { nil }
+  init(stringValue: String) { self.stringValue = stringValue }
+  init?(intValue: Int) { nil }
+}
+
+private struct Node: Encodable {
+  var props: [String: String]
+  var children: [Node]
+
+  func encode(to encoder: Encoder) throws {
+    var container = encoder.container(keyedBy: NodeKey.self)
+    for (key, value) in props {
+      try container.encode(value, forKey: NodeKey(stringValue: key))
+    }
+    try container.encode(children, forKey: NodeKey(stringValue: "children"))
+  }
+}
+
+/// Depth-first walk with an explicit stack that records each node's
+/// properties and parent index in pre-order, then assembles the Node values
+/// from the last index back so every subtree is complete before its parent.
+private func extractTree(_ roots: [_ViewDebug.Data]) -> [Node] {
+  var props = ContiguousArray<[String: String]>()
+  var parents = ContiguousArray<Int>()
+  var stack: [(parent: Int, node: _ViewDebug.Data)] = roots.reversed().map { (-1, $0) }
+  while let entry = stack.popLast() {
+    let shadow = readShadow(entry.node)
+    var nodeProps = [String: String](minimumCapacity: shadow.data.count)
+    for (property, value) in shadow.data {
+      nodeProps[label(for: property)] = format(value)
+    }
+    let index = props.count
+    props.append(nodeProps)
+    parents.append(entry.parent)
+    for child in shadow.childData.reversed() {
+      stack.append((index, child))
+    }
+  }
+
+  var children = ContiguousArray<[Node]>(repeating: [], count: props.count)
+  var result = [Node]()
+  for index in props.indices.reversed() {
+    let node = Node(props: props[index], children: children[index].reversed())
+    if parents[index] < 0 {
+      result.append(node)
+    } else {
+      children[parents[index]].append(node)
+    }
+  }
+  return result.reversed()
+}
+
+/// Writes the `_viewDebugData()` tree of the `_UIHostingView` at `view` as
+/// JSON to `path`. Returns false if encoding or writing fails.
+@_cdecl("axe_extract_viewdebugdata")
+public func axeExtractViewDebugData(_ view: UnsafeRawPointer, _ path: UnsafePointer<CChar>) -> Bool {
+  let hostingView = Unmanaged<_UIHostingView<AnyView>>.fromOpaque(view).takeUnretainedValue()
+  guard let json = try? JSONEncoder().encode(extractTree(hostingView._viewDebugData())) else {
+    return false
+  }
+  let url = URL(fileURLWithPath: String(cString: path))
+  return (try? json.write(to: url, options: .atomic)) != nil
+}